@@ -1,8 +1,18 @@
 import sys
 import os
-import time
+import json
+import secrets
 import shutil
 import sqlite3
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+try:
+    # optional: decodes on worker threads release the GIL in libjpeg/zlib
+    from PIL import Image
+except ImportError:
+    Image = None
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QPushButton,
     QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout,
@@ -10,15 +20,93 @@ from PyQt5.QtWidgets import (
     QListView, QAbstractItemView, QMenu, QInputDialog,
     QSizePolicy, QFileDialog
 )
-from PyQt5.QtGui import QPixmap, QKeySequence, QIcon, QImage
-from PyQt5.QtCore import Qt, QSize, QPoint, QThread, pyqtSignal
+from PyQt5.QtGui import (
+    QPixmap, QKeySequence, QIcon, QImage, QImageReader, QImageWriter
+)
+from PyQt5.QtCore import (
+    Qt, QSize, QPoint, QThread, pyqtSignal, QObject, QRunnable, QThreadPool,
+    QTimer, QByteArray, QBuffer, QIODevice
+)
+
+# held as constants so sqlite3's per-connection statement cache hits on
+# the identical SQL text instead of re-parsing each call
+SQL_ALL_TAGS   = "SELECT tag FROM tags"
+SQL_SEARCH_ART = "SELECT id, name, filepath, thumb_path, artist, tags FROM artworks"
+# default view: newest first, bounded so the list widget stays snappy
+SQL_RECENT_ART = SQL_SEARCH_ART + " ORDER BY timestamp DESC LIMIT 500"
+SQL_SEARCH_FTS = (
+    "SELECT a.id, a.name, a.filepath, a.thumb_path, a.artist, a.tags "
+    "FROM art_fts JOIN artworks a ON a.id = art_fts.rowid "
+    "WHERE art_fts MATCH ?"
+)
+
+# stale originals/thumbs are unlinked on a low-priority daemon thread so
+# the save path never waits on filesystem metadata writes
+_janitor_q = queue.SimpleQueue()
+_janitor_thread = None
 
-class SaveArtWorker(QThread):
+def _janitor_loop():
+    while True:
+        path = _janitor_q.get()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+def _janitor_unlink(path):
+    global _janitor_thread
+    if _janitor_thread is None:
+        _janitor_thread = threading.Thread(target=_janitor_loop, daemon=True)
+        _janitor_thread.start()
+    _janitor_q.put(path)
+
+
+class SaveSignals(QObject):
     finished = pyqtSignal(int, str)   # art_id, filepath
     error    = pyqtSignal(str)
 
+class SearchSignals(QObject):
+    results = pyqtSignal(int, list)   # generation, rows
+
+class SearchTask(QRunnable):
+    """Runs one search on the read-only connection off the GUI thread.
+
+    Queries are tried in order so the FTS MATCH can fall back to LIKE."""
+
+    def __init__(self, ro_conn, queries, generation):
+        super().__init__()
+        self.signals    = SearchSignals()
+        self.ro_conn    = ro_conn
+        self.queries    = queries
+        self.generation = generation
+
+    def run(self):
+        rows = []
+        for sql, params in self.queries:
+            try:
+                rows = self.ro_conn.execute(sql, params).fetchall()
+                break
+            except sqlite3.Error:
+                # OperationalError triggers the LIKE fallback; a
+                # ProgrammingError (connection closed under us during a
+                # wipe) just yields empty rows, which the generation
+                # check on the GUI side discards anyway
+                continue
+        self.signals.results.emit(self.generation, rows)
+
+class SaveArtTask(QRunnable):
+    # One long-lived writer connection shared by all save tasks; the save
+    # pool is capped at a single thread so access is serialized.
+    _writer_conn = None
+
+    # clipboard images larger than this on either edge get downscaled
+    # before encoding; zlib level 3 encodes 2-3x faster than the default
+    MAX_DIM         = 2048
+    PNG_COMPRESSION = 3
+
     def __init__(self, image, name, artist, tags, image_dir, db_path, existing):
         super().__init__()
+        self.signals   = SaveSignals()
         self.image     = image
         self.name      = name
         self.artist    = artist
@@ -27,58 +115,149 @@ class SaveArtWorker(QThread):
         self.db_path   = db_path
         self.existing  = existing  # tuple (id, old_path) or None
 
+    def _conn(self):
+        cls = SaveArtTask
+        if cls._writer_conn is None:
+            cls._writer_conn = sqlite3.connect(
+                self.db_path, timeout=5, check_same_thread=False)
+            cls._writer_conn.execute("PRAGMA journal_mode=WAL;")
+            cls._writer_conn.execute("PRAGMA busy_timeout=5000;")
+            cls._writer_conn.execute("PRAGMA mmap_size=268435456;")
+        return cls._writer_conn
+
     def run(self):
         try:
 
-            # 1) save full-size PNG
-            fname = f"art_{int(time.time())}.png"
+            # 1) save full-size PNG, downscaling oversized clipboard grabs
+            fname = f"art_{secrets.token_hex(6)}.png"
             full  = os.path.join(self.image_dir, fname)
-            self.image.save(full)
+            image = self.image
+            if image.width() > self.MAX_DIM or image.height() > self.MAX_DIM:
+                image = image.scaled(self.MAX_DIM, self.MAX_DIM,
+                                     Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            writer = QImageWriter(full)
+            writer.setCompression(self.PNG_COMPRESSION)
+            writer.write(image)
 
             # ‣ create thumbs folder if needed
             thumb_dir = os.path.join(self.image_dir, "thumbs")
             os.makedirs(thumb_dir, exist_ok=True)
 
-            # 2) generate & save 64×64 thumbnail
-            pix   = QPixmap.fromImage(self.image)
-            thumb = pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            thumb.save(os.path.join(thumb_dir, fname))
+            # 2) generate & save 64×64 thumbnail (persisted so searches
+            #    never have to re-decode the full-size original)
+            thumb_path = os.path.join(thumb_dir, fname)
+            _make_thumb(image).save(thumb_path)
 
-            # 3) open its own DB connection
-            conn = sqlite3.connect(self.db_path, timeout=5)
-            conn.execute("PRAGMA journal_mode=WAL;")
-            conn.execute("PRAGMA busy_timeout=5000;")
+            # 3) reuse the pool's writer connection
+            conn = self._conn()
             c    = conn.cursor()
+            # one transaction bounds the artwork upsert + junction + tag inserts
+            conn.execute("BEGIN")
+            old_files = []
             if self.existing:
                 art_id, old = self.existing
                 c.execute(
-                    "UPDATE artworks SET name=?, filepath=?, artist=?, tags=?, timestamp=CURRENT_TIMESTAMP WHERE id=?",
-                    (self.name, full, self.artist, ','.join(sorted(self.tags)), art_id)
+                    "UPDATE artworks SET name=?, filepath=?, thumb_path=?, artist=?, tags=?, timestamp=CURRENT_TIMESTAMP WHERE id=?",
+                    (self.name, full, thumb_path, self.artist, json.dumps(sorted(self.tags)), art_id)
                 )
-                try: os.remove(old)
-                except: pass
-                old_thumb = os.path.join(thumb_dir, os.path.basename(old))
-                try:
-                    os.remove(old_thumb)
-                except OSError:
-                    pass
+                if old:
+                    old_files = [old, os.path.join(thumb_dir, os.path.basename(old))]
             else:
                 c.execute(
-                    "INSERT INTO artworks (name, filepath, artist, tags) VALUES (?, ?, ?, ?)",
-                    (self.name, full, self.artist, ','.join(sorted(self.tags)))
+                    "INSERT INTO artworks (name, filepath, thumb_path, artist, tags) VALUES (?, ?, ?, ?, ?)",
+                    (self.name, full, thumb_path, self.artist, json.dumps(sorted(self.tags)))
                 )
                 art_id = c.lastrowid
-            
-            for t in self.tags:
-                try: c.execute("INSERT INTO tags (tag) VALUES (?)", (t,))
-                except sqlite3.IntegrityError: pass
+
+            # refresh the junction rows for this artwork
+            c.execute("DELETE FROM artwork_tags WHERE art_id=?", (art_id,))
+            c.executemany(
+                "INSERT OR IGNORE INTO artwork_tags (art_id, tag) VALUES (?, ?)",
+                [(art_id, t) for t in self.tags]
+            )
+
+            c.executemany(
+                "INSERT OR IGNORE INTO tags (tag) VALUES (?)",
+                ((t,) for t in self.tags)
+            )
             conn.commit()
-            conn.close()
+
+            # DB state is durable; the old files can go whenever the
+            # janitor gets to them
+            for p in old_files:
+                _janitor_unlink(p)
 
             # 4) emit finish
-            self.finished.emit(art_id, full)
+            self.signals.finished.emit(art_id, full)
         except Exception as e:
-            self.error.emit(str(e))
+            # the connection outlives this task, so never leave a
+            # transaction dangling
+            try:
+                self._conn().rollback()
+            except sqlite3.Error:
+                pass
+            self.signals.error.emit(str(e))
+
+def _make_thumb(image):
+    # two-step downscale: a smooth filter straight from a 4000px source
+    # touches every source pixel, so take a cheap nearest-neighbour hop
+    # down to ~256px first and only run the smooth pass on that
+    if image.width() > 512 or image.height() > 512:
+        image = image.scaled(256, 256, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+class ThumbTask(QRunnable):
+    # decodes + scales one image on the global thread pool; QImage (unlike
+    # QPixmap) is safe to use off the GUI thread
+    def __init__(self, src_path, thumb_path):
+        super().__init__()
+        self.src_path   = src_path
+        self.thumb_path = thumb_path
+
+    def run(self):
+        # ask the decoder for a reduced image up front — for JPEG this is
+        # IDCT scaling in libjpeg, skipping most of the pixel output work
+        reader = QImageReader(self.src_path)
+        size = reader.size()
+        if size.isValid():
+            s = max(size.width() // 256, size.height() // 256, 1)
+            if s > 1:
+                reader.setScaledSize(QSize(size.width() // s, size.height() // s))
+        img = reader.read()
+        if not img.isNull():
+            _make_thumb(img).save(self.thumb_path, "PNG")
+
+
+def _fastcopy(src, dst, st=None):
+    # copy via os.sendfile (kernel-side, zero userspace copies) where
+    # available, else a 1 MiB readinto loop; preserves mtime like copy2
+    # without a second stat when the caller already has one
+    if st is None:
+        st = os.stat(src)
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        offset, remaining = 0, st.st_size
+        try:
+            while remaining > 0:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        except (AttributeError, OSError):
+            # only fall back if nothing was copied yet — sendfile doesn't
+            # advance fsrc's position, so retrying after a partial copy
+            # would duplicate the bytes already written
+            if offset:
+                raise
+            buf = memoryview(bytearray(1 << 20))
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                fdst.write(buf[:n])
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
 
 class ImportFolderWorker(QThread):
     finished = pyqtSignal(str)
@@ -98,44 +277,69 @@ class ImportFolderWorker(QThread):
         conn = sqlite3.connect(self.db_path, timeout=30)
         try:
             conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
             conn.execute("PRAGMA busy_timeout=30000;")
+            conn.execute("PRAGMA mmap_size=268435456;")
             c = conn.cursor()
 
+            rows = []
+            # scandir gives is_file()/stat() from the readdir buffer,
+            # skipping the extra stat syscall per entry that listdir +
+            # isfile paid
+            with os.scandir(self.folder) as entries:
+                for i, entry in enumerate(entries):
+                    # coalesced progress: a signal per file floods the GUI thread
+                    if i % 16 == 0:
+                        self.progress.emit(entry.name)
+
+                    if not entry.is_file():
+                        continue
+                    fname = entry.name
+                    ext = os.path.splitext(fname)[1].lower()
+                    if ext not in (".png", ".jpg", ".jpeg", ".bmp", ".gif"):
+                        continue
+
+                    # 1) copy file, reusing the stat scandir already has
+                    dst_name = f"art_{secrets.token_hex(6)}_{fname}"
+                    dst      = os.path.join(self.image_dir, dst_name)
+                    _fastcopy(entry.path, dst, entry.stat())
+
+                    # 2) thumbnail on the global pool so decodes use all cores
+                    thumb_path = os.path.join(thumb_dir, dst_name)
+                    QThreadPool.globalInstance().start(ThumbTask(dst, thumb_path))
+
+                    # 3) collect the DB row; inserted in one batch below
+                    base = os.path.splitext(fname)[0]
+                    rows.append((base, dst, thumb_path, "", "[]"))
+
+            # all thumbs on disk before anyone can search for them
+            QThreadPool.globalInstance().waitForDone()
+
+            # one transaction for the whole batch: one fsync instead of N
             duplicates = []
-            for fname in os.listdir(self.folder):
-                # emit progress before handling each file
-                self.progress.emit(fname)
-
-
-                src = os.path.join(self.folder, fname)
-                if not os.path.isfile(src):
-                    continue
-                ext = os.path.splitext(fname)[1].lower()
-                if ext not in (".png", ".jpg", ".jpeg", ".bmp", ".gif"):
-                    continue
-
-                # 1) copy file
-                dst_name = f"art_{int(time.time())}_{fname}"
-                dst      = os.path.join(self.image_dir, dst_name)
-                shutil.copy2(src, dst)
-
-                # 2) generate & save thumbnail
-                pix   = QPixmap(dst)
-                thumb = pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                thumb.save(os.path.join(thumb_dir, dst_name))
-
-                # 3) insert DB row
-                base = os.path.splitext(fname)[0]
-                try:
-                    c.execute(
-                        "INSERT INTO artworks (name, filepath, artist, tags) VALUES (?, ?, ?, ?)",
-                        (base, dst, "", "")
-                    )
-                except sqlite3.IntegrityError:
-                    # name already exists
-                    duplicates.append(base)
-
-
+            if rows:
+                conn.execute("BEGIN IMMEDIATE")
+                # chunk the name lookup: one ? per name would blow
+                # SQLITE_MAX_VARIABLE_NUMBER on very large imports
+                names = [r[0] for r in rows]
+                taken = set()
+                for i in range(0, len(names), 500):
+                    batch = names[i:i + 500]
+                    placeholders = ",".join("?" * len(batch))
+                    taken.update(r[0] for r in c.execute(
+                        f"SELECT name FROM artworks WHERE name IN ({placeholders})",
+                        batch))
+                to_insert = []
+                for row in rows:
+                    if row[0] in taken:
+                        duplicates.append(row[0])
+                    else:
+                        taken.add(row[0])
+                        to_insert.append(row)
+                c.executemany(
+                    "INSERT INTO artworks (name, filepath, thumb_path, artist, tags) VALUES (?, ?, ?, ?, ?)",
+                    to_insert
+                )
             conn.commit()
 
             msg = None
@@ -153,6 +357,33 @@ class ImportFolderWorker(QThread):
 
 
 class ArtManager(QMainWindow):
+    # cross-thread handoff from the thumb reader pool to the GUI thread;
+    # (art_id, payload, width, height) — width 0 means encoded file bytes
+    thumb_ready = pyqtSignal(int, bytes, int, int)
+
+    ICON_CACHE_MAX = 4096
+
+    # GUI-thread statements, keyed once at class scope: sqlite3 caches
+    # prepared statements by SQL text, so reusing these constants avoids
+    # a re-parse on every call
+    _SQL = {
+        "insert_tag":       "INSERT OR IGNORE INTO tags (tag) VALUES (?)",
+        "delete_tag":       "DELETE FROM tags WHERE tag=?",
+        "rename_tag":       "UPDATE tags SET tag=? WHERE tag=?",
+        "tag_art_ids":      "SELECT art_id FROM artwork_tags WHERE tag=?",
+        "untag_all":        "DELETE FROM artwork_tags WHERE tag=?",
+        "retag_all":        "UPDATE artwork_tags SET tag=? WHERE tag=?",
+        "delete_art_tags":  "DELETE FROM artwork_tags WHERE art_id=?",
+        "art_name_path":    "SELECT name, filepath FROM artworks WHERE id=?",
+        "art_paths":        "SELECT filepath, thumb_path FROM artworks WHERE id=?",
+        "art_by_name":      "SELECT id, filepath FROM artworks WHERE name=?",
+        "delete_art":       "DELETE FROM artworks WHERE id=?",
+        "update_name":      "UPDATE artworks SET name=? WHERE id=?",
+        "update_thumb":     "UPDATE artworks SET thumb_path=? WHERE filepath=?",
+        "replace_art":      "UPDATE artworks SET filepath=?, thumb_path=?, "
+                            "timestamp=CURRENT_TIMESTAMP WHERE id=?",
+    }
+
     def __init__(self):
         super().__init__()
         base = os.path.join(os.path.expanduser("~"), "ArtManager")
@@ -162,18 +393,44 @@ class ArtManager(QMainWindow):
         self.current_tags = set()
         self.current_art_id = None
         self.current_image = None  # QImage
+        self._current_pixmap = None  # cached QPixmap of current_image
+        # (source pixmap, label size, scaled pixmap) of the last display
+        self._disp_cache = (None, QSize(), None)
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._search_pool = QThreadPool(self)
+        self._search_pool.setMaxThreadCount(1)
+        self._search_gen = 0
+        self._thumb_pool = ThreadPoolExecutor(max_workers=8)
+        self._pending_thumb_items = {}
+        # LRU of decoded thumbnail icons keyed by thumb path; entries are
+        # evicted explicitly when an artwork is deleted or replaced
+        self._icon_cache = OrderedDict()
+        self.thumb_ready.connect(self._on_thumb_ready)
         self.init_db()
+        # keep query plans fresh as the library grows
+        self._optimize_timer = QTimer(self)
+        self._optimize_timer.setInterval(15 * 60 * 1000)
+        self._optimize_timer.timeout.connect(
+            lambda: self.conn.execute("PRAGMA optimize;"))
+        self._optimize_timer.start()
         self.init_ui()
         self.search_art()  # initial load
 
     def init_db(self):
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, cached_statements=256)
+        # WAL lets the save worker commit without blocking GUI-thread reads;
+        # synchronous=NORMAL halves the fsyncs per commit
+        for pragma in ("journal_mode=WAL", "synchronous=NORMAL", "temp_store=MEMORY",
+                       "mmap_size=268435456", "cache_size=-20000", "busy_timeout=5000"):
+            self.conn.execute(f"PRAGMA {pragma};")
         c = self.conn.cursor()
         c.execute("""
         CREATE TABLE IF NOT EXISTS artworks (
             id INTEGER PRIMARY KEY,
             name TEXT UNIQUE,
             filepath TEXT UNIQUE,
+            thumb_path TEXT,
             artist TEXT,
             tags TEXT,
             timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
@@ -182,7 +439,129 @@ class ArtManager(QMainWindow):
         CREATE TABLE IF NOT EXISTS tags (
             tag TEXT PRIMARY KEY
         )""")
+        c.execute("""
+        CREATE TABLE IF NOT EXISTS artwork_tags (
+            art_id INTEGER,
+            tag TEXT,
+            PRIMARY KEY (art_id, tag)
+        )""")
+        # covering (tag, art_id) index: tag lookups never touch the table
+        c.execute("DROP INDEX IF EXISTS idx_at_tag")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_at_tag_art ON artwork_tags(tag, art_id)")
+        # migrate databases created before the thumb cache existed
+        try:
+            c.execute("ALTER TABLE artworks ADD COLUMN thumb_path TEXT")
+        except sqlite3.OperationalError:
+            pass
+        c.execute("CREATE INDEX IF NOT EXISTS idx_artworks_name ON artworks(name COLLATE NOCASE)")
+        # the lowercased generated columns are no longer queried — the
+        # LIKE fallback runs on search_blob now — so drop them and their
+        # index from older databases instead of maintaining dead weight
+        # (DROP COLUMN needs SQLite >= 3.35; older builds just keep them)
+        c.execute("DROP INDEX IF EXISTS idx_name_lc")
+        for col in ("name_lc", "artist_lc", "tags_lc"):
+            try:
+                c.execute(f"ALTER TABLE artworks DROP COLUMN {col}")
+            except sqlite3.OperationalError:
+                pass
+        # backfill the junction from the old comma-joined column
+        if c.execute("SELECT COUNT(*) FROM artwork_tags").fetchone()[0] == 0:
+            for art_id, tags in c.execute(
+                    "SELECT id, tags FROM artworks WHERE tags != '' AND tags NOT LIKE '[%'").fetchall():
+                c.executemany(
+                    "INSERT OR IGNORE INTO artwork_tags (art_id, tag) VALUES (?, ?)",
+                    [(art_id, t) for t in tags.split(',') if t]
+                )
+        # migrate comma-joined tag strings to JSON arrays
+        rows = c.execute(
+            "SELECT id, tags FROM artworks WHERE tags != '' AND tags NOT LIKE '[%'").fetchall()
+        c.executemany(
+            "UPDATE artworks SET tags=? WHERE id=?",
+            [(json.dumps(sorted(t for t in tags.split(',') if t)), art_id)
+             for art_id, tags in rows]
+        )
+        c.execute("UPDATE artworks SET tags='[]' WHERE tags='' OR tags IS NULL")
+        # backfill thumb_path for rows from before the column existed, so
+        # search never has to derive it per row
+        rows = c.execute(
+            "SELECT id, filepath FROM artworks WHERE thumb_path IS NULL OR thumb_path=''").fetchall()
+        if rows:
+            thumb_dir = os.path.join(self.image_dir, "thumbs")
+            c.executemany(
+                "UPDATE artworks SET thumb_path=? WHERE id=?",
+                [(os.path.join(thumb_dir, os.path.basename(fp)), art_id)
+                 for art_id, fp in rows]
+            )
+        # pre-lowercased concatenation of the searchable fields, kept up
+        # to date by triggers so the LIKE fallback pays one comparison per
+        # term instead of three
+        try:
+            c.execute("ALTER TABLE artworks ADD COLUMN search_blob TEXT")
+        except sqlite3.OperationalError:
+            pass
+        blob_expr = ("lower(coalesce(new.name,'') || ' ' || "
+                     "coalesce(new.artist,'') || ' ' || coalesce(new.tags,''))")
+        c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS artworks_blob_ai AFTER INSERT ON artworks BEGIN
+            UPDATE artworks SET search_blob = {blob_expr} WHERE id = new.id;
+        END""")
+        c.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS artworks_blob_au
+        AFTER UPDATE OF name, artist, tags ON artworks BEGIN
+            UPDATE artworks SET search_blob = {blob_expr} WHERE id = new.id;
+        END""")
+        c.execute("""
+        UPDATE artworks SET search_blob =
+            lower(coalesce(name,'') || ' ' || coalesce(artist,'') || ' ' || coalesce(tags,''))
+        WHERE search_blob IS NULL""")
+        # full-text index over the searchable fields, kept in sync by
+        # triggers; searches fall back to LIKE if the build lacks FTS5
+        self._fts_ok = True
+        try:
+            c.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS art_fts USING fts5(
+                name, artist, tags, content='artworks', content_rowid='id'
+            )""")
+            c.execute("""
+            CREATE TRIGGER IF NOT EXISTS artworks_fts_ai AFTER INSERT ON artworks BEGIN
+                INSERT INTO art_fts(rowid, name, artist, tags)
+                VALUES (new.id, new.name, new.artist, new.tags);
+            END""")
+            c.execute("""
+            CREATE TRIGGER IF NOT EXISTS artworks_fts_ad AFTER DELETE ON artworks BEGIN
+                INSERT INTO art_fts(art_fts, rowid, name, artist, tags)
+                VALUES ('delete', old.id, old.name, old.artist, old.tags);
+            END""")
+            # column-scoped so search_blob/timestamp writes don't churn
+            # the index (DROP first: IF NOT EXISTS keeps the old shape)
+            c.execute("DROP TRIGGER IF EXISTS artworks_fts_au")
+            c.execute("""
+            CREATE TRIGGER artworks_fts_au
+            AFTER UPDATE OF name, artist, tags ON artworks BEGIN
+                INSERT INTO art_fts(art_fts, rowid, name, artist, tags)
+                VALUES ('delete', old.id, old.name, old.artist, old.tags);
+                INSERT INTO art_fts(rowid, name, artist, tags)
+                VALUES (new.id, new.name, new.artist, new.tags);
+            END""")
+            # counting art_fts itself would delegate to the content table
+            # and always match; the docsize shadow table reflects what is
+            # actually indexed, so this also repairs an empty index
+            if (c.execute("SELECT count(*) FROM art_fts_docsize").fetchone()[0]
+                    != c.execute("SELECT count(*) FROM artworks").fetchone()[0]):
+                c.execute("INSERT INTO art_fts(art_fts) VALUES('rebuild')")
+        except sqlite3.OperationalError:
+            self._fts_ok = False
         self.conn.commit()
+        self._cur = self.conn.cursor()
+        # second, read-only connection used by the off-thread search task
+        # (one RW + one RO keeps the GUI connection free of search scans)
+        try:
+            self._ro_conn = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            # search scans the whole table; mmap reads are pointer loads
+            self._ro_conn.execute("PRAGMA mmap_size=268435456;")
+        except sqlite3.OperationalError:
+            self._ro_conn = None
 
     def init_ui(self):
         self.setWindowTitle("Art Manager")
@@ -232,6 +611,13 @@ class ArtManager(QMainWindow):
         search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search tags, name, artist...")
+        # live search, debounced so rapid typing coalesces into one query;
+        # Enter still fires immediately
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self.search_art)
+        self.search_input.textChanged.connect(self._search_timer.start)
         self.search_input.returnPressed.connect(self.search_art)
         search_btn = QPushButton("Search")
         search_btn.clicked.connect(self.search_art)
@@ -358,7 +744,7 @@ class ArtManager(QMainWindow):
         self._import_worker.start()
 
     def handle_result_click(self, item):
-        art_id, name, path, artist, tags = item.data(Qt.UserRole)
+        art_id, name, path, thumb_path, artist, tags = item.data(Qt.UserRole)
         if art_id == self.current_art_id:
             # Deselect
             self.clear_selection()
@@ -369,6 +755,8 @@ class ArtManager(QMainWindow):
         self.current_art_id = None
         self.current_tags.clear()
         self.current_image = None
+        self._current_pixmap = None
+        self._disp_cache = (None, QSize(), None)
         self.name_input.clear()
         self.artist_input.clear()
         self.image_label.setText("Paste or select an image")
@@ -376,25 +764,31 @@ class ArtManager(QMainWindow):
         self.load_tags()
 
     def load_tags(self):
-        self.tag_list.clear()
-        c = self.conn.cursor()
-        all_tags = [row[0] for row in c.execute("SELECT tag FROM tags")]
+        all_tags = [row[0] for row in self.conn.execute(SQL_ALL_TAGS)]
         selected = sorted([t for t in all_tags if t in self.current_tags])
         unselected = sorted([t for t in all_tags if t not in self.current_tags])
-        for tag in selected + unselected:
-            item = QListWidgetItem(tag)
-            if tag in self.current_tags:
-                item.setBackground(self.palette().highlight())
-            self.tag_list.addItem(item)
+        self.tag_list.setUpdatesEnabled(False)
+        self.tag_list.blockSignals(True)
+        try:
+            self.tag_list.clear()
+            for tag in selected + unselected:
+                item = QListWidgetItem(tag)
+                if tag in self.current_tags:
+                    item.setBackground(self.palette().highlight())
+                self.tag_list.addItem(item)
+        finally:
+            self.tag_list.blockSignals(False)
+            self.tag_list.setUpdatesEnabled(True)
 
     def add_tag(self):
         tag = self.new_tag_input.text().strip().lower()
         if not tag: return
-        c = self.conn.cursor()
-        try:
-            c.execute("INSERT INTO tags (tag) VALUES (?)", (tag,))
+        # OR IGNORE instead of catching IntegrityError; rowcount says
+        # whether the tag was actually new
+        self._cur.execute(self._SQL["insert_tag"], (tag,))
+        if self._cur.rowcount:
             self.conn.commit(); self.new_tag_input.clear(); self.load_tags()
-        except sqlite3.IntegrityError:
+        else:
             QMessageBox.information(self, "Duplicate Tag", f"'{tag}' already exists.")
 
     def tag_context_menu(self, pos: QPoint):
@@ -414,32 +808,50 @@ class ArtManager(QMainWindow):
             if ok and new.strip():
                 self.rename_tag(tag, new.strip().lower())
 
+    def _refresh_tag_column(self, c, art_ids):
+        # keep the denormalized artworks.tags column (used for display)
+        # in sync with the junction table: one SELECT over the affected
+        # ids, one executemany, instead of two statements per row
+        if not art_ids:
+            return
+        # chunk the id lookup like the importer's duplicate-name check:
+        # one ? per id would blow SQLITE_MAX_VARIABLE_NUMBER on big tags
+        grouped = {art_id: [] for art_id in art_ids}
+        for i in range(0, len(art_ids), 500):
+            batch = art_ids[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            for art_id, tag in c.execute(
+                    f"SELECT art_id, tag FROM artwork_tags WHERE art_id IN ({placeholders}) ORDER BY tag",
+                    batch):
+                grouped[art_id].append(tag)
+        c.executemany(
+            "UPDATE artworks SET tags=? WHERE id=?",
+            [(json.dumps(tags), art_id) for art_id, tags in grouped.items()]
+        )
+
     def remove_tag(self, tag):
-        c = self.conn.cursor()
-        c.execute("DELETE FROM tags WHERE tag=?", (tag,))
-        rows = c.execute("SELECT id, tags FROM artworks WHERE tags LIKE ?", (f"%{tag}%",)).fetchall()
-        for art_id, tags in rows:
-            new_tags = [t for t in tags.split(',') if t != tag]
-            c.execute("UPDATE artworks SET tags=? WHERE id=?", (','.join(new_tags), art_id))
+        c = self._cur
+        c.execute(self._SQL["delete_tag"], (tag,))
+        ids = [r[0] for r in c.execute(self._SQL["tag_art_ids"], (tag,)).fetchall()]
+        c.execute(self._SQL["untag_all"], (tag,))
+        self._refresh_tag_column(c, ids)
         self.conn.commit()
         self.current_tags.discard(tag)
         self.search_art()
         self.load_tags()
 
     def rename_tag(self, old, new):
-        c = self.conn.cursor()
-        # First update artworks to replace the tag
-        rows = c.execute("SELECT id, tags FROM artworks WHERE tags LIKE ?", (f"%{old}%",)).fetchall()
-        for art_id, tags in rows:
-            updated = [new if t == old else t for t in tags.split(',')]
-            c.execute("UPDATE artworks SET tags=? WHERE id=?", (','.join(updated), art_id))
-        # Then update the tags table
+        c = self._cur
         try:
-            c.execute("UPDATE tags SET tag=? WHERE tag=?", (new, old))
+            c.execute(self._SQL["rename_tag"], (new, old))
         except sqlite3.IntegrityError:
             QMessageBox.information(self, "Rename Failed", f"Tag '{new}' already exists.")
             self.conn.rollback()
             return
+        # single indexed write instead of a LIKE scan over every artwork
+        c.execute(self._SQL["retag_all"], (new, old))
+        ids = [r[0] for r in c.execute(self._SQL["tag_art_ids"], (new,)).fetchall()]
+        self._refresh_tag_column(c, ids)
         self.conn.commit()
         # Update current_tags if needed
         if old in self.current_tags:
@@ -459,9 +871,10 @@ class ArtManager(QMainWindow):
     def paste_image(self):
         cb = QApplication.clipboard()
         if cb.mimeData().hasImage():
-            img = cb.image()    
+            img = cb.image()
             self.current_image = img
             pix = QPixmap.fromImage(img)
+            self._current_pixmap = pix
             self.display_image(pix)
             self.current_tags.clear()
             self.current_art_id = None
@@ -485,9 +898,8 @@ class ArtManager(QMainWindow):
 
         if self.current_art_id:
             # fetch old name & path
-            row = self.conn.cursor().execute(
-                "SELECT name, filepath FROM artworks WHERE id=?", 
-                (self.current_art_id,)
+            row = self._cur.execute(
+                self._SQL["art_name_path"], (self.current_art_id,)
             ).fetchone()
             if row:
                 old_name, old_path = row
@@ -515,16 +927,18 @@ class ArtManager(QMainWindow):
 
         # If brand‑new image (no current_art_id), check if name collides to overwrite
         if not existing and new_name:
-            row = self.conn.cursor().execute(
-                "SELECT id, filepath FROM artworks WHERE name=?", (new_name,)
+            row = self._cur.execute(
+                self._SQL["art_by_name"], (new_name,)
             ).fetchone()
             if row:
                 existing = row
 
-        # Spawn the worker to handle save/update/rename in one go
+        # Queue the task to handle save/update/rename in one go.
+        # copy() detaches from current_image so a paste while the task is
+        # still encoding can't mutate the pixels the worker is writing.
         self.save_btn.setEnabled(False)
-        self._save_thread = SaveArtWorker(
-            image     = self.current_image,
+        task = SaveArtTask(
+            image     = self.current_image.copy(),
             name      = new_name,
             artist    = artist,
             tags      = tags,
@@ -532,9 +946,11 @@ class ArtManager(QMainWindow):
             db_path   = self.db_path,
             existing  = existing
         )
-        self._save_thread.finished.connect(self.on_save_finished)
-        self._save_thread.error.connect(self.on_save_error)
-        self._save_thread.start()
+        task.signals.finished.connect(self.on_save_finished)
+        task.signals.error.connect(self.on_save_error)
+        # keep a reference so the signal proxy survives until delivery
+        self._save_task = task
+        self._save_pool.start(task)
 
 
     def on_save_finished(self, art_id, path):
@@ -553,12 +969,16 @@ class ArtManager(QMainWindow):
             self.statusBar().showMessage("No artwork selected", 2000)
             return
         if QMessageBox.question(self, "Delete", "Delete this artwork?", QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
-            c = self.conn.cursor()
-            row = c.execute("SELECT filepath FROM artworks WHERE id=?", (self.current_art_id,)).fetchone()
+            c = self._cur
+            row = c.execute(self._SQL["art_paths"], (self.current_art_id,)).fetchone()
             if row:
-                try: os.remove(row[0])
-                except: pass
-            c.execute("DELETE FROM artworks WHERE id=?", (self.current_art_id,))
+                self._icon_cache.pop(row[1], None)
+                for p in row:
+                    if p:
+                        try: os.remove(p)
+                        except: pass
+            c.execute(self._SQL["delete_art_tags"], (self.current_art_id,))
+            c.execute(self._SQL["delete_art"], (self.current_art_id,))
             self.conn.commit()
             self.current_art_id = None
             self.current_tags.clear()
@@ -570,11 +990,32 @@ class ArtManager(QMainWindow):
 
     def clear_all(self):
         if QMessageBox.question(self, "Wipe All", "Permanently delete ALL tags and artworks?", QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
+            # let any in-flight save finish, then drop the pool's cached
+            # writer connection — it would otherwise keep committing into
+            # the unlinked inode of the old database
+            self._save_pool.waitForDone()
+            if SaveArtTask._writer_conn is not None:
+                SaveArtTask._writer_conn.close()
+                SaveArtTask._writer_conn = None
             self.conn.close()
+            # invalidate any search still in flight so its rows can't
+            # repopulate the list after the wipe
+            self._search_gen += 1
+            if self._ro_conn is not None:
+                self._ro_conn.close()
             shutil.rmtree(self.image_dir, ignore_errors=True)
-            os.remove(self.db_path)
+            # in WAL mode the -wal/-shm sidecars are part of the dataset
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.remove(self.db_path + suffix)
+                except OSError:
+                    pass
             self.current_tags.clear()
             self.current_art_id = None
+            self._icon_cache.clear()
+            # forget items awaiting thumbnails — results_list.clear()
+            # deletes them, and a late thumb_ready must not touch them
+            self._pending_thumb_items.clear()
             os.makedirs(self.image_dir, exist_ok=True)
             self.init_db()
             self.load_tags()
@@ -589,37 +1030,144 @@ class ArtManager(QMainWindow):
             cb.setImage(self.current_image)
             self.statusBar().showMessage("Image copied to clipboard", 2000)
 
+    def _thumb_icon(self, path, thumb_path):
+        # load the pre-scaled thumbnail; regenerate it from the original
+        # on a cache miss (e.g. databases from before the thumb cache)
+        if not thumb_path or not os.path.exists(thumb_path):
+            thumb_dir = os.path.join(self.image_dir, "thumbs")
+            os.makedirs(thumb_dir, exist_ok=True)
+            thumb_path = os.path.join(thumb_dir, os.path.basename(path))
+            pix = QPixmap(path)
+            if not pix.isNull():
+                # nearest-neighbour is indistinguishable at 64px and much
+                # cheaper; this path runs on the GUI thread
+                pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.FastTransformation).save(thumb_path)
+            self._cur.execute(self._SQL["update_thumb"], (thumb_path, path))
+            self.conn.commit()
+        return QIcon(thumb_path)
+
+    def _build_search_queries(self, terms):
+        # candidate queries in preference order: FTS prefix match, then
+        # the LIKE fallback over the search_blob column
+        queries = []
+        if terms:
+            if self._fts_ok:
+                match = " ".join('"{}"*'.format(t.replace('"', '""')) for t in terms)
+                queries.append((SQL_SEARCH_FTS, (match,)))
+            sql = SQL_SEARCH_ART + " WHERE " + " AND ".join(
+                f"search_blob LIKE ?{i}" for i in range(1, len(terms) + 1)
+            )
+            queries.append((sql, [f"%{t}%" for t in terms]))
+        else:
+            queries.append((SQL_RECENT_ART, ()))
+        return queries
+
     def search_art(self):
+        # cancel a pending debounce so Enter or the Search button right
+        # after typing doesn't run the same query a second time
+        self._search_timer.stop()
         terms = [t for t in self.search_input.text().strip().lower().split() if t]
-        self.results_list.clear()
-        c = self.conn.cursor()
-        for row in c.execute("SELECT id, name, filepath, artist, tags FROM artworks"):
-            art_id, name, path, artist, tags = row
-            name_val = (name or "").lower()
-            artist_val = (artist or "").lower()
-            tag_vals = [t.lower() for t in tags.split(',')] if tags else []
-            # match if all terms present in any field
-            if all(any(term in field for field in [name_val, artist_val] + tag_vals) for term in terms):
-                icon = QIcon(path.replace("images", "images/thumbs", 1))
-                item = QListWidgetItem(icon, name or os.path.basename(path))
-                item.setData(Qt.UserRole, row)
-                self.results_list.addItem(item)
-        # show all if empty search
-        if not terms:
+        queries = self._build_search_queries(terms)
+        self._search_gen += 1
+        if self._ro_conn is not None:
+            task = SearchTask(self._ro_conn, queries, self._search_gen)
+            task.signals.results.connect(self._on_search_results)
+            self._search_task = task
+            self._search_pool.start(task)
+            return
+        # no read-only connection: run synchronously on the GUI thread
+        rows = []
+        for sql, params in queries:
+            try:
+                rows = self._cur.execute(sql, params).fetchall()
+                break
+            except sqlite3.OperationalError:
+                continue
+        self._populate_results(rows)
+
+    def _on_search_results(self, generation, rows):
+        if generation != self._search_gen:
+            return  # a newer search superseded this one
+        self._populate_results(rows)
+
+    def _populate_results(self, rows):
+        # build all items first, then swap them in with updates and
+        # signals suspended so the view lays out and repaints exactly once
+        self._pending_thumb_items.clear()
+        items = []
+        for row in rows:
+            art_id, name, path, thumb_path, artist, tags = row
+            if thumb_path and os.path.exists(thumb_path):
+                icon = self._icon_cache.get(thumb_path)
+                if icon is not None:
+                    self._icon_cache.move_to_end(thumb_path)
+                    item = QListWidgetItem(icon, name or os.path.basename(path))
+                else:
+                    # placeholder now; the reader pool fills the icon in
+                    item = QListWidgetItem(QIcon(), name or os.path.basename(path))
+                    self._pending_thumb_items[art_id] = (item, thumb_path)
+                    self._thumb_pool.submit(self._read_thumb, art_id, thumb_path)
+            else:
+                # cache miss: regenerate synchronously so it persists
+                item = QListWidgetItem(self._thumb_icon(path, thumb_path),
+                                       name or os.path.basename(path))
+            item.setData(Qt.UserRole, row)
+            items.append(item)
+        self.results_list.setUpdatesEnabled(False)
+        self.results_list.blockSignals(True)
+        try:
             self.results_list.clear()
-            for row in c.execute("SELECT id, name, filepath, artist, tags FROM artworks"):
-                art_id, name, path, artist, tags = row
-                icon = QIcon(path.replace("images", "images/thumbs", 1))
-                item = QListWidgetItem(icon, name or os.path.basename(path))
-                item.setData(Qt.UserRole, row)
+            for item in items:
                 self.results_list.addItem(item)
+        finally:
+            self.results_list.blockSignals(False)
+            self.results_list.setUpdatesEnabled(True)
+
+    def _read_thumb(self, art_id, thumb_path):
+        # executor thread: no Qt objects here. With Pillow available the
+        # decode happens off the GUI thread and ships raw RGBA; otherwise
+        # ship the encoded bytes and let the GUI slot decode.
+        try:
+            if Image is not None:
+                with Image.open(thumb_path) as img:
+                    img.thumbnail((64, 64), Image.LANCZOS)
+                    rgba = img.convert("RGBA")
+                self.thumb_ready.emit(art_id, rgba.tobytes(), rgba.width, rgba.height)
+            else:
+                with open(thumb_path, "rb") as f:
+                    self.thumb_ready.emit(art_id, f.read(), 0, 0)
+        except OSError:
+            pass
+
+    def _cache_icon(self, thumb_path, icon):
+        self._icon_cache[thumb_path] = icon
+        if len(self._icon_cache) > self.ICON_CACHE_MAX:
+            self._icon_cache.popitem(last=False)
+
+    def _on_thumb_ready(self, art_id, data, width, height):
+        pending = self._pending_thumb_items.pop(art_id, None)
+        if pending is None:
+            return  # results were repopulated since this read was queued
+        item, thumb_path = pending
+        if width:
+            # copy() detaches from the signal payload before it is freed
+            qimg = QImage(data, width, height, 4 * width,
+                          QImage.Format_RGBA8888).copy()
+            pix = QPixmap.fromImage(qimg)
+        else:
+            pix = QPixmap()
+            pix.loadFromData(data)
+        if not pix.isNull():
+            icon = QIcon(pix)
+            self._cache_icon(thumb_path, icon)
+            item.setIcon(icon)
 
     def on_results_context(self, pos):
         # Map the click into an item
         item = self.results_list.itemAt(pos)
         if not item:
             return
-        art_id, name, path, artist, tags = item.data(Qt.UserRole)
+        art_id, name, path, thumb_path, artist, tags = item.data(Qt.UserRole)
 
         menu = QMenu()
         rename = menu.addAction("Rename Image…")
@@ -631,8 +1179,7 @@ class ArtManager(QMainWindow):
                 return
             new_name = new_name.strip()
             # 1) update DB
-            c = self.conn.cursor()
-            c.execute("UPDATE artworks SET name=? WHERE id=?", (new_name, art_id))
+            self._cur.execute(self._SQL["update_name"], (new_name, art_id))
             self.conn.commit()
             # 2) reload search
             self.search_art()
@@ -644,27 +1191,45 @@ class ArtManager(QMainWindow):
             
 
     def open_art(self, item):
-        art_id, name, path, artist, tags = item.data(Qt.UserRole)
-        pix = QPixmap(path)
-        self.current_image = pix.toImage()
+        art_id, name, path, thumb_path, artist, tags = item.data(Qt.UserRole)
+        # decode once into a QImage; QPixmap(path) + toImage() was a full
+        # second copy of the pixel data
+        img = QImage(path)
+        self.current_image = img
+        pix = QPixmap.fromImage(img)
+        self._current_pixmap = pix
         self.display_image(pix)
         self.current_art_id = art_id
         self.original_name  = name
         self.name_input.setText(name)
         self.artist_input.setText(artist)
-        self.current_tags = set(tags.split(',')) if tags else set()
+        self.current_tags = set(json.loads(tags)) if tags else set()
         self.load_tags()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if self.current_image:
-            pix = QPixmap.fromImage(self.current_image)
-            self.display_image(pix)
+        # reuse the cached pixmap; converting current_image again would
+        # re-upload the full image on every resize step
+        if self._current_pixmap:
+            src, size, _ = self._disp_cache
+            new = self.image_label.size()
+            # during a drag-resize, skip rescaling until the label has
+            # moved a noticeable amount from the cached size
+            if (src is self._current_pixmap
+                    and abs(new.width() - size.width()) < 16
+                    and abs(new.height() - size.height()) < 16):
+                return
+            self.display_image(self._current_pixmap)
 
     def display_image(self, pix):
-        self.image_label.setPixmap(pix.scaled(
-            self.image_label.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation
-        ))
+        src, size, scaled = self._disp_cache
+        target = self.image_label.size()
+        if src is pix and size == target:
+            self.image_label.setPixmap(scaled)
+            return
+        scaled = pix.scaled(target, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self._disp_cache = (pix, QSize(target), scaled)
+        self.image_label.setPixmap(scaled)
 
     def replace_image(self):
         # Paste into existing art, preserve metadata
@@ -675,25 +1240,37 @@ class ArtManager(QMainWindow):
             img = cb.image()
             self.current_image = img
             pix = QPixmap.fromImage(img)
+            self._current_pixmap = pix
             self.display_image(pix)
             # update DB file for this art
-            fname = f"art_{int(time.time())}.png"
-            thumb = pix.scaled(64,64,Qt.KeepAspectRatio,Qt.SmoothTransformation)
-            thumb.save(os.path.join(self.image_dir, "thumbs", fname))
+            fname = f"art_{secrets.token_hex(6)}.png"
+            thumb_path = os.path.join(self.image_dir, "thumbs", fname)
+            _make_thumb(img).save(thumb_path)
             path = os.path.join(self.image_dir, fname)
-            img.save(path)
-            c = self.conn.cursor()
-            # get old filepath
-            old = c.execute("SELECT filepath FROM artworks WHERE id=?", (self.current_art_id,)).fetchone()[0]
-            c.execute("UPDATE artworks SET filepath=?, timestamp=CURRENT_TIMESTAMP WHERE id=?", (path, self.current_art_id))
+            # encode once to memory, then land the file atomically so a
+            # crash mid-write can't leave a truncated PNG behind
+            buf = QByteArray()
+            qbuf = QBuffer(buf)
+            qbuf.open(QIODevice.WriteOnly)
+            writer = QImageWriter(qbuf, b"PNG")
+            writer.setCompression(SaveArtTask.PNG_COMPRESSION)
+            writer.write(img)
+            qbuf.close()
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(buf.data())
+            os.replace(tmp, path)
+            # get old file + thumb so the stale cache entry goes away too
+            old, old_thumb = self._cur.execute(
+                self._SQL["art_paths"], (self.current_art_id,)).fetchone()
+            self._cur.execute(self._SQL["replace_art"],
+                              (path, thumb_path, self.current_art_id))
             self.conn.commit()
 
-            try: 
-
-                os.remove(old)
-
-                os.remove(old.rpartition("\\")[0]+"\\thumbs\\"+old.rpartition("\\")[2])
-            except: pass
+            self._icon_cache.pop(old_thumb, None)
+            for p in (old, old_thumb):
+                if p:
+                    _janitor_unlink(p)
             self.search_art()
         else:
             self.statusBar().showMessage("No image in clipboard to replace", 2000)